@@ -2,45 +2,45 @@
 """
 Fetch and parse Medium article content.
 Used as a backup when n8n's built-in HTTP node has issues with Medium.
+Requires selectolax: pip install -r scripts/requirements.txt
 """
 
 import sys
 import json
-import re
+import gzip
 from urllib.request import urlopen, Request
-from html.parser import HTMLParser
 
+from selectolax.lexbor import LexborHTMLParser
 
-class ArticleParser(HTMLParser):
-    """Parse article content from Medium HTML."""
+CHUNK_SIZE = 65536
+ARTICLE_END = b"</article>"
 
-    def __init__(self):
-        super().__init__()
-        self.in_article = False
-        self.in_paragraph = False
-        self.paragraphs = []
-        self.current_text = ""
 
-    def handle_starttag(self, tag, attrs):
-        attrs_dict = dict(attrs)
-        if tag == "article":
-            self.in_article = True
-        elif tag == "p" and self.in_article:
-            self.in_paragraph = True
-            self.current_text = ""
+def _article_paragraphs(tree: LexborHTMLParser) -> list:
+    """Return the non-trivial paragraph texts inside <article> elements."""
+    paragraphs = []
+    for node in tree.css("article p"):
+        text = node.text().strip()
+        if len(text) > 20:
+            paragraphs.append(text)
+    return paragraphs
 
-    def handle_endtag(self, tag):
-        if tag == "article":
-            self.in_article = False
-        elif tag == "p" and self.in_paragraph:
-            self.in_paragraph = False
-            text = self.current_text.strip()
-            if text and len(text) > 20:
-                self.paragraphs.append(text)
 
-    def handle_data(self, data):
-        if self.in_paragraph:
-            self.current_text += data
+def _read_article(stream) -> LexborHTMLParser:
+    """Read the page in chunks, stopping at a closing article tag once paragraphs have been found.
+
+    An early </article> with no paragraphs (e.g. a related-posts card) does not end the read.
+    """
+    html = bytearray()
+    while chunk := stream.read(CHUNK_SIZE):
+        # The closing tag may straddle the previous chunk boundary
+        start = max(0, len(html) - len(ARTICLE_END) + 1)
+        html += chunk
+        end = html.rfind(ARTICLE_END, start)
+        # Only count paragraphs closed by that tag, not a later article the chunk cut off
+        if end != -1 and _article_paragraphs(LexborHTMLParser(html[: end + len(ARTICLE_END)].decode("utf-8", "replace"))):
+            break
+    return LexborHTMLParser(html.decode("utf-8", "replace"))
 
 
 def fetch_article(url: str) -> dict:
@@ -48,25 +48,31 @@ def fetch_article(url: str) -> dict:
     headers = {
         "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)",
         "Accept": "text/html,application/xhtml+xml",
+        "Accept-Encoding": "gzip",
     }
 
     try:
         req = Request(url, headers=headers)
         with urlopen(req, timeout=30) as response:
-            html = response.read().decode("utf-8")
+            content_type = response.headers.get_content_type()
+            if "html" not in content_type:
+                return {"error": f"Unexpected content type: {content_type}", "success": False}
+
+            stream = response
+            if response.headers.get("Content-Encoding") == "gzip":
+                stream = gzip.GzipFile(fileobj=response)
+            tree = _read_article(stream)
     except Exception as e:
         return {"error": str(e), "success": False}
 
     # Extract title
-    title_match = re.search(r"<title>([^<]+)</title>", html)
-    title = title_match.group(1) if title_match else "Untitled"
-    title = title.split("|")[0].strip()
+    title_node = tree.css_first("title")
+    title = title_node.text().strip() if title_node else ""
+    title = (title or "Untitled").partition("|")[0].strip()
 
     # Parse content
-    parser = ArticleParser()
-    parser.feed(html)
-
-    content = "\n\n".join(parser.paragraphs)
+    paragraphs = _article_paragraphs(tree)
+    content = "\n\n".join(paragraphs)
     word_count = len(content.split())
 
     return {
@@ -1,11 +1,10 @@
 ﻿#!/usr/bin/env python3
 """Configure Telegram webhook for the subscription API service."""
 
+import http.client
 import json
 import os
 import sys
-from urllib.parse import urlencode
-from urllib.request import Request, urlopen
 
 
 def main() -> int:
@@ -37,26 +36,24 @@ def main() -> int:
     if secret:
         payload["secret_token"] = secret
 
-    req = Request(
-        f"https://api.telegram.org/bot{token}/setWebhook",
-        data=json.dumps(payload).encode("utf-8"),
-        headers={"Content-Type": "application/json"},
-        method="POST",
+    # setWebhook and getWebhookInfo share one keep-alive TLS connection.
+    conn = http.client.HTTPSConnection("api.telegram.org", timeout=15)
+    conn.request(
+        "POST",
+        f"/bot{token}/setWebhook",
+        json.dumps(payload).encode("utf-8"),
+        {"Content-Type": "application/json"},
     )
-
-    with urlopen(req, timeout=15) as resp:
-        body = json.loads(resp.read().decode("utf-8"))
+    body = json.loads(conn.getresponse().read().decode("utf-8"))
 
     print(json.dumps(body, indent=2))
     if not body.get("ok"):
+        conn.close()
         return 1
 
-    info_req = Request(
-        f"https://api.telegram.org/bot{token}/getWebhookInfo?{urlencode({})}",
-        method="GET",
-    )
-    with urlopen(info_req, timeout=15) as resp:
-        info = json.loads(resp.read().decode("utf-8"))
+    conn.request("GET", f"/bot{token}/getWebhookInfo")
+    info = json.loads(conn.getresponse().read().decode("utf-8"))
+    conn.close()
 
     print("\nWebhook info:")
     print(json.dumps(info, indent=2))
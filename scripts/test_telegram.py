@@ -7,14 +7,14 @@ Run this to verify your bot token and chat ID are correct.
 import os
 import sys
 import json
-from urllib.request import urlopen, Request
-from urllib.error import HTTPError, URLError
+import http.client
+
+# Both checks talk to the same host, so reuse one keep-alive TLS connection.
+_conn = http.client.HTTPSConnection("api.telegram.org", timeout=10)
 
 
 def send_telegram_message(bot_token: str, chat_id: str, message: str) -> dict:
     """Send a test message via Telegram Bot API."""
-    url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
-
     data = json.dumps({
         "chat_id": chat_id,
         "text": message,
@@ -22,27 +22,34 @@ def send_telegram_message(bot_token: str, chat_id: str, message: str) -> dict:
     }).encode("utf-8")
 
     headers = {"Content-Type": "application/json"}
-    req = Request(url, data=data, headers=headers, method="POST")
 
     try:
-        with urlopen(req, timeout=10) as response:
-            return json.loads(response.read().decode("utf-8"))
-    except HTTPError as e:
-        return {"ok": False, "error": e.read().decode("utf-8")}
-    except URLError as e:
-        return {"ok": False, "error": str(e.reason)}
+        _conn.request("POST", f"/bot{bot_token}/sendMessage", data, headers)
+        response = _conn.getresponse()
+        body = response.read().decode("utf-8")
+    except (OSError, http.client.HTTPException) as e:
+        _conn.close()
+        return {"ok": False, "error": str(e)}
+
+    if response.status >= 400:
+        return {"ok": False, "error": body}
+    return json.loads(body)
 
 
 def get_bot_info(bot_token: str) -> dict:
     """Get bot information to verify token."""
-    url = f"https://api.telegram.org/bot{bot_token}/getMe"
-
     try:
-        with urlopen(url, timeout=10) as response:
-            return json.loads(response.read().decode("utf-8"))
-    except Exception as e:
+        _conn.request("GET", f"/bot{bot_token}/getMe")
+        response = _conn.getresponse()
+        body = response.read().decode("utf-8")
+    except (OSError, http.client.HTTPException) as e:
+        _conn.close()
         return {"ok": False, "error": str(e)}
 
+    if response.status >= 400:
+        return {"ok": False, "error": body}
+    return json.loads(body)
+
 
 def main():
     # Get credentials from environment or arguments
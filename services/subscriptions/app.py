@@ -10,18 +10,24 @@ Implements an end-to-end flow:
 
 from __future__ import annotations
 
-import json
+import asyncio
+import bisect
+import http.client
 import os
 import re
 import secrets
+import sqlite3
+import threading
 import time
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
 from pathlib import Path
-from tempfile import NamedTemporaryFile
-from typing import Any
-from urllib.error import HTTPError, URLError
+from typing import Any, AsyncIterator, Iterator
 from urllib.parse import quote
 from urllib.request import Request, urlopen
 
+import httpx
+import orjson
 from fastapi import FastAPI, Header, HTTPException, Request as FastAPIRequest
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
@@ -36,6 +42,8 @@ DATA_DIR = Path(os.getenv("SUBSCRIPTION_DATA_DIR", "/tmp/subscriptions"))
 PENDING_FILE = DATA_DIR / "pending_subscriptions.json"
 SUBSCRIPTIONS_FILE = DATA_DIR / "subscriptions.json"
 LINK_STATUS_FILE = DATA_DIR / "subscription_link_status.json"
+DB_FILE = DATA_DIR / "subscriptions.db"
+BOT_USERNAME_FILE = DATA_DIR / "bot_username"
 KV_REST_URL = (
     os.getenv("KV_REST_API_URL", "").strip()
     or os.getenv("UPSTASH_REDIS_REST_URL", "").strip()
@@ -62,9 +70,17 @@ def _env_int(name: str, default: int) -> int:
 
 LINK_TTL_SECONDS = _env_int("SUBSCRIPTION_LINK_TTL_SECONDS", 900)
 LINK_STATUS_RETENTION_SECONDS = _env_int("SUBSCRIPTION_LINK_STATUS_RETENTION_SECONDS", 86400)
+# Compact state blobs by default; pretty mode is only for inspecting stored state by hand.
+STATE_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS if _env_int("SUBSCRIPTION_STATE_PRETTY", 0) else 0
+BROADCAST_CONCURRENCY = 25
+# Telegram allows roughly 30 messages per second per bot; stay just under it.
+BROADCAST_RATE_PER_SECOND = 28
+BROADCAST_BURST = 30
+PRUNE_INTERVAL_SECONDS = 300
 BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN", "").strip()
 BOT_USERNAME = os.getenv("TELEGRAM_BOT_USERNAME", "").strip().lstrip("@").lower()
 WEBHOOK_SECRET = os.getenv("TELEGRAM_WEBHOOK_SECRET", "").strip()
+STORAGE_CHAT_ID = os.getenv("TELEGRAM_STORAGE_CHAT_ID", "").strip()
 DEFAULT_TOPICS = sorted(
     {
         topic.strip().lower()
@@ -75,7 +91,59 @@ DEFAULT_TOPICS = sorted(
         if TOPIC_PATTERN.match(topic.strip().lower())
     }
 )
+_DEFAULT_TOPIC_SET = frozenset(DEFAULT_TOPICS)
 _BOT_USERNAME_CACHE: str | None = BOT_USERNAME or None
+# Sync connection for _telegram_api (bot username lookup); message sends use _telegram_async_client().
+_tg_conn = http.client.HTTPSConnection("api.telegram.org", timeout=10)
+_tg_lock = threading.Lock()
+_tg_async_client: httpx.AsyncClient | None = None
+_tg_async_client_loop: asyncio.AbstractEventLoop | None = None
+_tg_request_client: ContextVar[httpx.AsyncClient | None] = ContextVar("_tg_request_client", default=None)
+_prune_task: asyncio.Task | None = None
+_warm_task: asyncio.Task | None = None
+_db_conn: sqlite3.Connection | None = None
+_db_lock = threading.Lock()
+_db_init_lock = threading.Lock()
+_db_readers = threading.local()
+# PRAGMA user_version once legacy JSON state has been imported.
+DB_SCHEMA_VERSION = 1
+# "version" key of the KV subscriptions blob; 2 stores topic chat ids as ints.
+SUBSCRIPTIONS_BLOB_VERSION = 2
+
+DB_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pending (
+    token TEXT PRIMARY KEY,
+    topic TEXT NOT NULL,
+    created_at INTEGER NOT NULL,
+    expires_at INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS pending_expires_at ON pending (expires_at);
+
+CREATE TABLE IF NOT EXISTS chats (
+    chat_id INTEGER PRIMARY KEY,
+    username TEXT,
+    first_name TEXT,
+    last_name TEXT,
+    updated_at INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS subscriptions (
+    chat_id INTEGER NOT NULL,
+    topic TEXT NOT NULL,
+    PRIMARY KEY (chat_id, topic)
+);
+CREATE INDEX IF NOT EXISTS subscriptions_topic ON subscriptions (topic);
+
+CREATE TABLE IF NOT EXISTS link_status (
+    token TEXT PRIMARY KEY,
+    topic TEXT NOT NULL,
+    created_at INTEGER NOT NULL,
+    expires_at INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    confirmed_at INTEGER
+);
+CREATE INDEX IF NOT EXISTS link_status_expires_at ON link_status (expires_at);
+"""
 
 _cors_origins_raw = os.getenv("TELEGRAM_SUBSCRIPTION_CORS_ORIGINS", "*").strip()
 if _cors_origins_raw == "*":
@@ -106,10 +174,54 @@ class TopicBroadcastRequest(BaseModel):
     disable_web_page_preview: bool = True
 
 
+class AsyncTokenBucket:
+    """Async rate limiter allowing ``rate`` acquisitions per second with bursts of up to ``burst``."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock: asyncio.Lock | None = None
+        self._lock_loop: asyncio.AbstractEventLoop | None = None
+
+    def _loop_lock(self) -> asyncio.Lock:
+        # asyncio.Lock binds to one event loop; the bucket is a module global, so keep one lock per loop.
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+    async def acquire(self) -> None:
+        async with self._loop_lock():
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
+
+
+_tg_rate = AsyncTokenBucket(rate=BROADCAST_RATE_PER_SECOND, burst=BROADCAST_BURST)
+
+
 def _ensure_data_dir() -> None:
     DATA_DIR.mkdir(parents=True, exist_ok=True)
 
 
+def _use_kv() -> bool:
+    return bool(KV_REST_URL and KV_REST_TOKEN)
+
+
 def _storage_key(path: Path) -> str:
     return f"{KV_KEY_PREFIX}:{path.stem}"
 
@@ -129,52 +241,212 @@ def _kv_request(command: str, *parts: str, body: bytes | None = None) -> dict[st
         headers["Content-Type"] = "text/plain; charset=utf-8"
     req = Request(url, data=body, headers=headers, method="POST" if body is not None else "GET")
     with urlopen(req, timeout=10) as resp:
-        return json.loads(resp.read().decode("utf-8"))
+        return orjson.loads(resp.read())
+
+
+def _kv_command(*args: str) -> dict[str, Any]:
+    if not KV_REST_URL or not KV_REST_TOKEN:
+        raise RuntimeError("KV REST URL/token not configured")
+
+    headers = {"Authorization": f"Bearer {KV_REST_TOKEN}", "Content-Type": "application/json"}
+    req = Request(KV_REST_URL.rstrip("/"), data=orjson.dumps(list(args)), headers=headers, method="POST")
+    with urlopen(req, timeout=10) as resp:
+        return orjson.loads(resp.read())
+
+
+def _decode_kv_value(raw: Any, default: Any) -> Any:
+    if raw is None:
+        return default
+    if isinstance(raw, str):
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            return default
+    return raw
 
 
 def _read_json(path: Path, default: Any) -> Any:
-    if KV_REST_URL and KV_REST_TOKEN:
+    if _use_kv():
         key = _storage_key(path)
         try:
             payload = _kv_request("get", key)
         except Exception:
             return default
-        raw = payload.get("result")
-        if raw is None:
-            return default
-        if isinstance(raw, str):
-            try:
-                return json.loads(raw)
-            except json.JSONDecodeError:
-                return default
-        return raw
+        return _decode_kv_value(payload.get("result"), default)
 
+    # Local JSON files are only read to migrate state into the SQLite store.
     if not path.exists():
         return default
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    return orjson.loads(path.read_bytes())
 
 
-def _write_json_atomic(path: Path, payload: Any) -> None:
-    if KV_REST_URL and KV_REST_TOKEN:
-        key = _storage_key(path)
-        serialized = json.dumps(payload, ensure_ascii=True, sort_keys=True)
-        result = _kv_request("set", key, body=serialized.encode("utf-8"))
-        if result.get("error"):
-            raise RuntimeError(f"KV set failed: {result['error']}")
-        return
+def _kv_set_json(path: Path, payload: Any) -> None:
+    key = _storage_key(path)
+    serialized = orjson.dumps(payload, option=STATE_JSON_OPTIONS)
+    result = _kv_request("set", key, body=serialized)
+    if result.get("error"):
+        raise RuntimeError(f"KV set failed: {result['error']}")
+
+
+def _read_json_many(defaults: dict[Path, Any]) -> dict[Path, Any]:
+    """Read several state blobs with a single MGET; counterpart of _flush_all."""
+    paths = list(defaults)
+    try:
+        payload = _kv_command("MGET", *(_storage_key(path) for path in paths))
+    except Exception:
+        return dict(defaults)
+    values = payload.get("result") or [None] * len(paths)
+    return {path: _decode_kv_value(raw, defaults[path]) for path, raw in zip(paths, values)}
+
+
+def _empty_subscriptions() -> dict[str, Any]:
+    return {"version": SUBSCRIPTIONS_BLOB_VERSION, "chats": {}, "topics": {}}
+
+
+def _migrate_chat_ids(subs: dict[str, Any]) -> bool:
+    # Unversioned blobs stored chat ids as strings; convert them to ints once.
+    if subs.get("version", 1) >= SUBSCRIPTIONS_BLOB_VERSION:
+        return False
+    topics = subs.get("topics", {})
+    subs["topics"] = {topic: sorted({int(chat_id) for chat_id in chat_ids}) for topic, chat_ids in topics.items()}
+    subs["version"] = SUBSCRIPTIONS_BLOB_VERSION
+    return True
 
-    _ensure_data_dir()
-    with NamedTemporaryFile("w", encoding="utf-8", delete=False, dir=DATA_DIR) as tmp:
-        json.dump(payload, tmp, ensure_ascii=True, indent=2, sort_keys=True)
-        tmp.flush()
-        os.fsync(tmp.fileno())
-        tmp_path = Path(tmp.name)
-    tmp_path.replace(path)
+
+def _read_subscriptions() -> dict[str, Any]:
+    subs = _read_json(SUBSCRIPTIONS_FILE, default=_empty_subscriptions())
+    if _migrate_chat_ids(subs):
+        _kv_set_json(SUBSCRIPTIONS_FILE, subs)
+    return subs
+
+
+def _flush_all(payloads: dict[Path, Any]) -> None:
+    """Write several state blobs with a single MSET so they land in one round-trip."""
+    args = ["MSET"]
+    for path, payload in payloads.items():
+        args.append(_storage_key(path))
+        args.append(orjson.dumps(payload, option=STATE_JSON_OPTIONS).decode("utf-8"))
+    result = _kv_command(*args)
+    if result.get("error"):
+        raise RuntimeError(f"KV mset failed: {result['error']}")
+
+
+def _import_legacy_json(db: sqlite3.Connection) -> None:
+    pending = _read_json(PENDING_FILE, default={})
+    db.executemany(
+        "INSERT OR IGNORE INTO pending (token, topic, created_at, expires_at) VALUES (?, ?, ?, ?)",
+        [
+            (token, str(record.get("topic", "")), int(record.get("created_at", 0)), int(record.get("expires_at", 0)))
+            for token, record in pending.items()
+            if isinstance(record, dict)
+        ],
+    )
+
+    subs = _read_json(SUBSCRIPTIONS_FILE, default={"chats": {}, "topics": {}})
+    db.executemany(
+        "INSERT OR IGNORE INTO chats (chat_id, username, first_name, last_name, updated_at) VALUES (?, ?, ?, ?, ?)",
+        [
+            (
+                int(chat_key),
+                chat_data.get("username"),
+                chat_data.get("first_name"),
+                chat_data.get("last_name"),
+                int(chat_data.get("updated_at", 0)),
+            )
+            for chat_key, chat_data in subs.get("chats", {}).items()
+            if isinstance(chat_data, dict)
+        ],
+    )
+    db.executemany(
+        "INSERT OR IGNORE INTO subscriptions (chat_id, topic) VALUES (?, ?)",
+        [
+            (int(chat_id), topic)
+            for topic, chat_ids in subs.get("topics", {}).items()
+            for chat_id in chat_ids
+        ],
+    )
+
+    statuses = _read_json(LINK_STATUS_FILE, default={})
+    db.executemany(
+        "INSERT OR IGNORE INTO link_status (token, topic, created_at, expires_at, status, confirmed_at) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        [
+            (
+                token,
+                str(record.get("topic", "")),
+                int(record.get("created_at", 0)),
+                int(record.get("expires_at", 0)),
+                str(record.get("status", "")),
+                record.get("confirmed_at"),
+            )
+            for token, record in statuses.items()
+            if isinstance(record, dict)
+        ],
+    )
+
+
+def _migrate_db(conn: sqlite3.Connection) -> None:
+    conn.executescript(DB_SCHEMA)
+    conn.execute("BEGIN IMMEDIATE")
+    if conn.execute("PRAGMA user_version").fetchone()[0] < DB_SCHEMA_VERSION:
+        _import_legacy_json(conn)
+        # Recorded in the same transaction, so a failed import is retried on the next start.
+        conn.execute(f"PRAGMA user_version = {DB_SCHEMA_VERSION}")
+    conn.execute("COMMIT")
+
+
+def _db() -> sqlite3.Connection:
+    global _db_conn
+    with _db_init_lock:
+        if _db_conn is None:
+            _ensure_data_dir()
+            conn = sqlite3.connect(DB_FILE, isolation_level=None, check_same_thread=False)
+            try:
+                conn.row_factory = sqlite3.Row
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                _migrate_db(conn)
+            except BaseException:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                conn.close()
+                raise
+            _db_conn = conn
+    return _db_conn
+
+
+@contextmanager
+def _db_transaction() -> Iterator[sqlite3.Connection]:
+    with _db_lock:
+        db = _db()
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            yield db
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        db.execute("COMMIT")
+
+
+def _db_reader() -> sqlite3.Connection:
+    """Per-thread autocommit connection for read-only queries; under WAL these never wait on writers."""
+    conn = getattr(_db_readers, "conn", None)
+    if conn is None:
+        _db()  # schema setup and legacy import happen once, on the writer connection
+        conn = sqlite3.connect(DB_FILE, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        _db_readers.conn = conn
+    return conn
+
+
+def _row_dict(row: sqlite3.Row) -> dict[str, Any]:
+    return {key: row[key] for key in row.keys() if row[key] is not None}
 
 
 def _sanitize_topic(topic: str) -> str:
     clean = topic.strip().lower()
+    if clean in _DEFAULT_TOPIC_SET:
+        return clean
     if not TOPIC_PATTERN.match(clean):
         raise HTTPException(status_code=400, detail="Invalid topic format")
     return clean
@@ -205,27 +477,116 @@ def _prune_link_status(statuses: dict[str, dict[str, Any]], now: int) -> dict[st
     return pruned
 
 
+def _prune_pending_rows(db: sqlite3.Connection, now: int) -> None:
+    db.execute("DELETE FROM pending WHERE expires_at <= ?", (now,))
+
+
+def _prune_link_status_rows(db: sqlite3.Connection, now: int) -> None:
+    cutoff = now - LINK_STATUS_RETENTION_SECONDS
+    db.execute(
+        "DELETE FROM link_status WHERE "
+        "(status = 'pending' AND expires_at <= ?) OR (status = 'confirmed' AND confirmed_at <= ?) "
+        "OR status NOT IN ('pending', 'confirmed')",
+        (cutoff, cutoff),
+    )
+
+
 def _telegram_api(method: str, payload: dict[str, Any]) -> dict[str, Any]:
     if not BOT_TOKEN:
         raise RuntimeError("TELEGRAM_BOT_TOKEN is not configured")
-    url = f"https://api.telegram.org/bot{BOT_TOKEN}/{method}"
-    data = json.dumps(payload).encode("utf-8")
-    req = Request(url, data=data, headers={"Content-Type": "application/json"}, method="POST")
+    path = f"/bot{BOT_TOKEN}/{method}"
+    data = orjson.dumps(payload)
+    with _tg_lock:
+        # Only the occasional sync call (getMe) uses this connection; sends go through the async client.
+        # Telegram drops it while idle between those calls, so reconnect once.
+        for attempt in range(2):
+            try:
+                _tg_conn.request("POST", path, data, {"Content-Type": "application/json"})
+                resp = _tg_conn.getresponse()
+                status = resp.status
+                raw = resp.read()
+                break
+            except (http.client.BadStatusLine, ConnectionResetError, BrokenPipeError) as exc:
+                _tg_conn.close()
+                if attempt:
+                    raise RuntimeError(f"Telegram API network error: {exc}") from exc
+            except (OSError, http.client.HTTPException) as exc:
+                _tg_conn.close()
+                raise RuntimeError(f"Telegram API network error: {exc}") from exc
+
+    if status >= 400:
+        raise RuntimeError(f"Telegram API HTTP error: {status}")
+    result = orjson.loads(raw)
+    if not result.get("ok"):
+        raise RuntimeError(f"Telegram API error: {result}")
+    return result
+
+
+def _new_telegram_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        base_url=f"https://api.telegram.org/bot{BOT_TOKEN}",
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=64),
+        timeout=10,
+    )
+
+
+def _telegram_async_client() -> httpx.AsyncClient | None:
+    client = _tg_request_client.get()
+    if client is not None:
+        return client
+    # The shared client's connections belong to the loop that opened it at startup.
+    if _tg_async_client is not None and _tg_async_client_loop is asyncio.get_running_loop():
+        return _tg_async_client
+    return None
+
+
+@asynccontextmanager
+async def _telegram_session() -> AsyncIterator[None]:
+    """Make an async Telegram client available to the calls inside the block.
+
+    Uses the shared client opened at startup when it belongs to the running loop. Hosts that
+    skip lifespan events may run each request on a fresh loop; those get a client scoped to
+    the block, closed on exit so its connections don't outlive the loop.
+    """
+    if _telegram_async_client() is not None:
+        yield
+        return
+    async with _new_telegram_client() as client:
+        token = _tg_request_client.set(client)
+        try:
+            yield
+        finally:
+            _tg_request_client.reset(token)
+
+
+async def _telegram_api_async(method: str, payload: dict[str, Any]) -> dict[str, Any]:
+    return await _telegram_post_async(method, orjson.dumps(payload))
+
+
+async def _telegram_post_async(method: str, body: bytes) -> dict[str, Any]:
+    if not BOT_TOKEN:
+        raise RuntimeError("TELEGRAM_BOT_TOKEN is not configured")
     try:
-        with urlopen(req, timeout=10) as resp:
-            result = json.loads(resp.read().decode("utf-8"))
-    except HTTPError as exc:
-        raise RuntimeError(f"Telegram API HTTP error: {exc.code}") from exc
-    except URLError as exc:
-        raise RuntimeError(f"Telegram API network error: {exc.reason}") from exc
+        async with _telegram_session():
+            resp = await _telegram_async_client().post(
+                f"/{method}",
+                content=body,
+                headers={"Content-Type": "application/json"},
+            )
+    except httpx.HTTPError as exc:
+        raise RuntimeError(f"Telegram API network error: {exc}") from exc
 
+    if resp.status_code >= 400:
+        raise RuntimeError(f"Telegram API HTTP error: {resp.status_code}")
+    result = orjson.loads(resp.content)
     if not result.get("ok"):
         raise RuntimeError(f"Telegram API error: {result}")
     return result
 
 
-def _send_message(chat_id: int, text: str) -> None:
-    _telegram_api(
+async def _send_message(chat_id: int, text: str) -> None:
+    await _telegram_api_async(
         "sendMessage",
         {
             "chat_id": chat_id,
@@ -235,11 +596,40 @@ def _send_message(chat_id: int, text: str) -> None:
     )
 
 
-def _send_audio(chat_id: int, audio_url: str, caption: str | None = None) -> None:
-    payload: dict[str, Any] = {"chat_id": chat_id, "audio": audio_url}
-    if caption:
-        payload["caption"] = caption
-    _telegram_api("sendAudio", payload)
+def _broadcast_requests(body: TopicBroadcastRequest) -> list[tuple[str, dict[str, Any]]]:
+    """Build the per-recipient API calls for a broadcast, without the chat_id."""
+    requests: list[tuple[str, dict[str, Any]]] = []
+    if body.text:
+        requests.append(
+            (
+                "sendMessage",
+                {
+                    "text": body.text,
+                    "disable_web_page_preview": body.disable_web_page_preview,
+                },
+            )
+        )
+    if body.audio_url:
+        payload: dict[str, Any] = {"audio": body.audio_url}
+        if body.caption:
+            payload["caption"] = body.caption
+        requests.append(("sendAudio", payload))
+    return requests
+
+
+async def _stage_broadcast(body: TopicBroadcastRequest) -> list[tuple[str, dict[str, Any]]]:
+    """Send the broadcast once to the storage chat and return copyMessage calls that fan it out."""
+    staged: list[tuple[str, dict[str, Any]]] = []
+    for method, payload in _broadcast_requests(body):
+        try:
+            result = await _telegram_api_async(method, {"chat_id": STORAGE_CHAT_ID, **payload})
+        except RuntimeError as exc:
+            raise HTTPException(status_code=502, detail=f"Could not stage broadcast in storage chat: {exc}") from exc
+        message_id = (result.get("result") or {}).get("message_id")
+        if message_id is None:
+            raise HTTPException(status_code=502, detail=f"Could not stage broadcast in storage chat: no message_id in {method} response")
+        staged.append(("copyMessage", {"from_chat_id": STORAGE_CHAT_ID, "message_id": message_id}))
+    return staged
 
 
 def _resolved_bot_username() -> str:
@@ -263,9 +653,35 @@ def _resolved_bot_username() -> str:
         )
 
     _BOT_USERNAME_CACHE = username
+    # Persist for other workers and restarts, tagged with the bot id so a new token is not served a stale name.
+    try:
+        _ensure_data_dir()
+        BOT_USERNAME_FILE.write_text(f"{BOT_TOKEN.partition(':')[0]}:{username}\n", encoding="utf-8")
+    except OSError:
+        pass
     return username
 
 
+def _warm_bot_username() -> None:
+    global _BOT_USERNAME_CACHE
+    if _BOT_USERNAME_CACHE or not BOT_TOKEN:
+        return
+
+    try:
+        bot_id, _, username = BOT_USERNAME_FILE.read_text(encoding="utf-8").strip().partition(":")
+    except OSError:
+        bot_id, username = "", ""
+    if username and bot_id == BOT_TOKEN.partition(":")[0]:
+        _BOT_USERNAME_CACHE = username
+        return
+
+    try:
+        _resolved_bot_username()
+    except HTTPException:
+        # Telegram unreachable; the first subscribe request retries getMe.
+        pass
+
+
 def _chat_topics(subs: dict[str, Any], chat_id: int) -> set[str]:
     chats = subs.get("chats", {})
     chat_data = chats.get(str(chat_id), {})
@@ -278,6 +694,7 @@ def _save_chat_topics(subs: dict[str, Any], chat_id: int, topics_for_chat: set[s
     chat_key = str(chat_id)
 
     existing = chats.get(chat_key, {})
+    old_topics = _chat_topics(subs, chat_id)
     chats[chat_key] = {
         "chat_id": chat_id,
         "username": existing.get("username"),
@@ -287,23 +704,266 @@ def _save_chat_topics(subs: dict[str, Any], chat_id: int, topics_for_chat: set[s
         "updated_at": now,
     }
 
-    for topic, chat_ids in list(topics.items()):
-        filtered_ids = {str(cid) for cid in chat_ids if str(cid) != chat_key}
-        if filtered_ids:
-            topics[topic] = sorted(filtered_ids)
+    # Topic chat-id lists are kept sorted, so only the topics that changed need touching.
+    for topic in old_topics - topics_for_chat:
+        chat_ids = topics.get(topic, [])
+        if chat_id in chat_ids:
+            chat_ids.remove(chat_id)
+        if not chat_ids:
+            topics.pop(topic, None)
+
+    for topic in topics_for_chat - old_topics:
+        chat_ids = topics.setdefault(topic, [])
+        if chat_id not in chat_ids:
+            bisect.insort(chat_ids, chat_id)
+
+
+def _store_pending_link(token: str, topic: str, now: int) -> None:
+    expires_at = now + LINK_TTL_SECONDS
+    if _use_kv():
+        state = _read_json_many({PENDING_FILE: {}, LINK_STATUS_FILE: {}})
+        pending = _prune_pending(state[PENDING_FILE], now)
+        pending[token] = {
+            "topic": topic,
+            "created_at": now,
+            "expires_at": expires_at,
+        }
+        statuses = _prune_link_status(state[LINK_STATUS_FILE], now)
+        statuses[token] = {
+            "topic": topic,
+            "created_at": now,
+            "expires_at": expires_at,
+            "status": "pending",
+        }
+        _flush_all({PENDING_FILE: pending, LINK_STATUS_FILE: statuses})
+        return
+
+    with _db_transaction() as db:
+        _prune_pending_rows(db, now)
+        _prune_link_status_rows(db, now)
+        db.execute(
+            "INSERT INTO pending (token, topic, created_at, expires_at) VALUES (?, ?, ?, ?)",
+            (token, topic, now, expires_at),
+        )
+        db.execute(
+            "INSERT INTO link_status (token, topic, created_at, expires_at, status) VALUES (?, ?, ?, ?, 'pending')",
+            (token, topic, now, expires_at),
+        )
+
+
+def _load_link_status(token: str, now: int) -> dict[str, Any] | None:
+    if _use_kv():
+        statuses = _read_json(LINK_STATUS_FILE, default={})
+        record = statuses.get(token)
+    else:
+        row = _db_reader().execute(
+            "SELECT topic, created_at, expires_at, status, confirmed_at FROM link_status WHERE token = ?",
+            (token,),
+        ).fetchone()
+        record = _row_dict(row) if row is not None else None
+
+    # Apply retention to the returned record only; expired rows are removed by the write paths.
+    if not isinstance(record, dict) or not _prune_link_status({token: record}, now):
+        return None
+    return record
+
+
+def _load_chat_topics(chat_id: int) -> set[str]:
+    if _use_kv():
+        subs = _read_subscriptions()
+        return _chat_topics(subs, chat_id)
+
+    rows = _db_reader().execute("SELECT topic FROM subscriptions WHERE chat_id = ?", (chat_id,)).fetchall()
+    return {row["topic"] for row in rows}
+
+
+def _unsubscribe_chat(chat_id: int, topic: str | None, now: int) -> set[str]:
+    """Remove one topic (or every topic when ``topic`` is None) and return what was removed."""
+    if _use_kv():
+        subs = _read_subscriptions()
+        topics_for_chat = _chat_topics(subs, chat_id)
+        removed = topics_for_chat if topic is None else topics_for_chat & {topic}
+        if removed:
+            _save_chat_topics(subs, chat_id, topics_for_chat - removed, now)
+            _kv_set_json(SUBSCRIPTIONS_FILE, subs)
+        return removed
+
+    with _db_transaction() as db:
+        if topic is None:
+            rows = db.execute("DELETE FROM subscriptions WHERE chat_id = ? RETURNING topic", (chat_id,)).fetchall()
         else:
-            del topics[topic]
+            rows = db.execute(
+                "DELETE FROM subscriptions WHERE chat_id = ? AND topic = ? RETURNING topic",
+                (chat_id, topic),
+            ).fetchall()
+        if rows:
+            db.execute("UPDATE chats SET updated_at = ? WHERE chat_id = ?", (now, chat_id))
+    return {row["topic"] for row in rows}
+
+
+def _confirm_subscription(token: str, chat_id: int, from_user: dict[str, Any], now: int) -> dict[str, Any] | None:
+    """Consume a pending link token and subscribe the chat to its topic.
+
+    Returns the consumed pending record, or None if the token is unknown or expired.
+    """
+    if _use_kv():
+        # Everything the confirmation touches is fetched in one round-trip and written back in one.
+        state = _read_json_many(
+            {PENDING_FILE: {}, SUBSCRIPTIONS_FILE: _empty_subscriptions(), LINK_STATUS_FILE: {}}
+        )
+        pending = _prune_pending(state[PENDING_FILE], now)
+        record = pending.pop(token, None)
+        if not record:
+            return None
+
+        topic = str(record.get("topic", "")).strip().lower()
+        if not topic:
+            _kv_set_json(PENDING_FILE, pending)
+            return record
+
+        subs = state[SUBSCRIPTIONS_FILE]
+        _migrate_chat_ids(subs)
+        chats = subs.setdefault("chats", {})
+        current_topics = _chat_topics(subs, chat_id)
+        current_topics.add(topic)
+        chats[str(chat_id)] = {
+            "chat_id": chat_id,
+            "username": from_user.get("username"),
+            "first_name": from_user.get("first_name"),
+            "last_name": from_user.get("last_name"),
+            "topics": sorted(current_topics),
+            "updated_at": now,
+        }
+
+        topic_chat_ids = subs.setdefault("topics", {}).setdefault(topic, [])
+        if chat_id not in topic_chat_ids:
+            bisect.insort(topic_chat_ids, chat_id)
+
+        statuses = _prune_link_status(state[LINK_STATUS_FILE], now)
+        statuses[token] = {
+            "topic": topic,
+            "created_at": int(record.get("created_at", now)),
+            "expires_at": int(record.get("expires_at", now)),
+            "status": "confirmed",
+            "confirmed_at": now,
+        }
+        _flush_all({PENDING_FILE: pending, SUBSCRIPTIONS_FILE: subs, LINK_STATUS_FILE: statuses})
+        return record
+
+    with _db_transaction() as db:
+        _prune_pending_rows(db, now)
+        row = db.execute(
+            "DELETE FROM pending WHERE token = ? RETURNING topic, created_at, expires_at",
+            (token,),
+        ).fetchone()
+        if row is None:
+            return None
+
+        record = _row_dict(row)
+        topic = str(record.get("topic", "")).strip().lower()
+        if not topic:
+            return record
+
+        db.execute(
+            "INSERT INTO chats (chat_id, username, first_name, last_name, updated_at) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT (chat_id) DO UPDATE SET username = excluded.username, first_name = excluded.first_name, "
+            "last_name = excluded.last_name, updated_at = excluded.updated_at",
+            (chat_id, from_user.get("username"), from_user.get("first_name"), from_user.get("last_name"), now),
+        )
+        db.execute("INSERT OR IGNORE INTO subscriptions (chat_id, topic) VALUES (?, ?)", (chat_id, topic))
+        _prune_link_status_rows(db, now)
+        db.execute(
+            "INSERT OR REPLACE INTO link_status (token, topic, created_at, expires_at, status, confirmed_at) "
+            "VALUES (?, ?, ?, ?, 'confirmed', ?)",
+            (token, topic, int(record.get("created_at", now)), int(record.get("expires_at", now)), now),
+        )
+    return record
+
+
+def _load_topic_chat_ids(topic: str) -> list[int]:
+    if _use_kv():
+        subs = _read_subscriptions()
+        return subs.get("topics", {}).get(topic, [])
+
+    rows = _db_reader().execute(
+        "SELECT chat_id FROM subscriptions WHERE topic = ? ORDER BY chat_id",
+        (topic,),
+    ).fetchall()
+    return [row["chat_id"] for row in rows]
 
-    for topic in topics_for_chat:
-        topic_chat_ids = set(topics.get(topic, []))
-        topic_chat_ids.add(chat_key)
-        topics[topic] = sorted(topic_chat_ids)
+
+def _load_subscriptions() -> dict[str, Any]:
+    if _use_kv():
+        subs = _read_subscriptions()
+        return {"chats": subs.get("chats", {}), "topics": subs.get("topics", {})}
+
+    db = _db_reader()
+    # A deferred transaction gives both queries one snapshot without taking the write lock.
+    db.execute("BEGIN")
+    try:
+        chat_rows = db.execute("SELECT * FROM chats").fetchall()
+        sub_rows = db.execute("SELECT topic, chat_id FROM subscriptions ORDER BY topic, chat_id").fetchall()
+    finally:
+        db.execute("COMMIT")
+
+    chats: dict[str, dict[str, Any]] = {
+        str(row["chat_id"]): {**dict(row), "topics": []} for row in chat_rows
+    }
+    topics: dict[str, list[int]] = {}
+    for row in sub_rows:
+        topics.setdefault(row["topic"], []).append(row["chat_id"])
+        chat_key = str(row["chat_id"])
+        if chat_key in chats:
+            chats[chat_key]["topics"].append(row["topic"])
+    return {"chats": chats, "topics": topics}
+
+
+def _prune_expired(now: int) -> None:
+    if _use_kv():
+        # KV blobs are pruned inline by their writers; a background read-modify-write
+        # here could overwrite a link stored or confirmed in between.
+        return
+
+    with _db_transaction() as db:
+        _prune_pending_rows(db, now)
+        _prune_link_status_rows(db, now)
+
+
+async def _periodic_prune() -> None:
+    while True:
+        try:
+            await asyncio.to_thread(_prune_expired, int(time.time()))
+        except Exception:  # pragma: no cover - storage failure path
+            pass
+        await asyncio.sleep(PRUNE_INTERVAL_SECONDS)
 
 
 @app.on_event("startup")
-def startup() -> None:
-    if not (KV_REST_URL and KV_REST_TOKEN):
-        _ensure_data_dir()
+async def startup() -> None:
+    global _prune_task, _warm_task, _tg_async_client, _tg_async_client_loop
+    if not _use_kv():
+        _db()
+    _tg_async_client = _new_telegram_client()
+    _tg_async_client_loop = asyncio.get_running_loop()
+    # getMe can block for the full timeout when Telegram is unreachable, so don't hold up startup;
+    # _resolved_bot_username covers any subscribe that arrives before the warm-up finishes.
+    _warm_task = asyncio.create_task(asyncio.to_thread(_warm_bot_username))
+    _prune_task = asyncio.create_task(_periodic_prune())
+
+
+@app.on_event("shutdown")
+async def shutdown() -> None:
+    global _prune_task, _warm_task, _tg_async_client, _tg_async_client_loop
+    if _prune_task is not None:
+        _prune_task.cancel()
+        _prune_task = None
+    if _warm_task is not None:
+        _warm_task.cancel()
+        _warm_task = None
+    if _tg_async_client is not None:
+        await _tg_async_client.aclose()
+        _tg_async_client = None
+        _tg_async_client_loop = None
 
 
 @app.get("/health")
@@ -313,8 +973,9 @@ def health() -> dict[str, Any]:
         "service": "telegram-subscriptions",
         "bot_username_configured": bool(BOT_USERNAME),
         "bot_token_configured": bool(BOT_TOKEN),
+        "storage_chat_configured": bool(STORAGE_CHAT_ID),
         "topics_count": len(DEFAULT_TOPICS),
-        "storage_mode": "kv_rest" if (KV_REST_URL and KV_REST_TOKEN) else "local_file",
+        "storage_mode": "kv_rest" if _use_kv() else "sqlite",
     }
 
 
@@ -336,24 +997,7 @@ def create_subscription_link(body: SubscribeRequest) -> dict[str, Any]:
     now = int(time.time())
     token = secrets.token_urlsafe(16)
     start_param = f"{START_PREFIX}{token}"
-
-    pending = _read_json(PENDING_FILE, default={})
-    pending = _prune_pending(pending, now)
-    pending[token] = {
-        "topic": topic,
-        "created_at": now,
-        "expires_at": now + LINK_TTL_SECONDS,
-    }
-    _write_json_atomic(PENDING_FILE, pending)
-    statuses = _read_json(LINK_STATUS_FILE, default={})
-    statuses = _prune_link_status(statuses, now)
-    statuses[token] = {
-        "topic": topic,
-        "created_at": now,
-        "expires_at": now + LINK_TTL_SECONDS,
-        "status": "pending",
-    }
-    _write_json_atomic(LINK_STATUS_FILE, statuses)
+    _store_pending_link(token, topic, now)
 
     return {
         "ok": True,
@@ -376,11 +1020,8 @@ def get_subscription_link_status(start_param: str) -> dict[str, Any]:
         raise HTTPException(status_code=400, detail="Invalid start parameter")
 
     now = int(time.time())
-    statuses = _read_json(LINK_STATUS_FILE, default={})
-    statuses = _prune_link_status(statuses, now)
-    _write_json_atomic(LINK_STATUS_FILE, statuses)
-    record = statuses.get(token)
-    if not isinstance(record, dict):
+    record = _load_link_status(token, now)
+    if record is None:
         return {"ok": True, "status": "invalid"}
 
     expires_at = int(record.get("expires_at", 0))
@@ -418,58 +1059,44 @@ async def telegram_webhook(
 
     if not text.startswith("/start") or " " not in text:
         if text == "/start":
-            _send_message(
+            await _send_message(
                 chat_id,
                 "Welcome. To subscribe, open the topic page and tap Subscribe on Telegram.\n"
                 "Commands: /topics, /unsubscribe <topic>, /unsubscribe_all",
             )
         elif text == "/topics":
-            subs = _read_json(SUBSCRIPTIONS_FILE, default={"chats": {}, "topics": {}})
-            topics_for_chat = sorted(_chat_topics(subs, chat_id))
+            topics_for_chat = sorted(await asyncio.to_thread(_load_chat_topics, chat_id))
             if topics_for_chat:
-                _send_message(chat_id, "You are subscribed to: " + ", ".join(topics_for_chat))
+                await _send_message(chat_id, "You are subscribed to: " + ", ".join(topics_for_chat))
             else:
-                _send_message(chat_id, "You are not subscribed to any topics yet.")
+                await _send_message(chat_id, "You are not subscribed to any topics yet.")
         elif text.startswith("/unsubscribe"):
             parts = text.split(maxsplit=1)
             if len(parts) == 1:
-                _send_message(chat_id, "Usage: /unsubscribe <topic> or /unsubscribe_all")
+                await _send_message(chat_id, "Usage: /unsubscribe <topic> or /unsubscribe_all")
             elif parts[1].strip().lower() == "all":
                 now = int(time.time())
-                subs = _read_json(SUBSCRIPTIONS_FILE, default={"chats": {}, "topics": {}})
-                topics_for_chat = _chat_topics(subs, chat_id)
-                if topics_for_chat:
-                    _save_chat_topics(subs, chat_id, set(), now)
-                    _write_json_atomic(SUBSCRIPTIONS_FILE, subs)
-                    _send_message(chat_id, "Unsubscribed from all topics.")
+                if await asyncio.to_thread(_unsubscribe_chat, chat_id, None, now):
+                    await _send_message(chat_id, "Unsubscribed from all topics.")
                 else:
-                    _send_message(chat_id, "You are not subscribed to any topics.")
+                    await _send_message(chat_id, "You are not subscribed to any topics.")
             else:
                 try:
                     target_topic = _sanitize_topic(parts[1].strip())
                 except HTTPException:
-                    _send_message(chat_id, "Topic format is invalid. Use lowercase letters, numbers, and hyphens.")
+                    await _send_message(chat_id, "Topic format is invalid. Use lowercase letters, numbers, and hyphens.")
                     return {"ok": True}
                 now = int(time.time())
-                subs = _read_json(SUBSCRIPTIONS_FILE, default={"chats": {}, "topics": {}})
-                topics_for_chat = _chat_topics(subs, chat_id)
-                if target_topic in topics_for_chat:
-                    topics_for_chat.remove(target_topic)
-                    _save_chat_topics(subs, chat_id, topics_for_chat, now)
-                    _write_json_atomic(SUBSCRIPTIONS_FILE, subs)
-                    _send_message(chat_id, f"Unsubscribed from: {target_topic}")
+                if await asyncio.to_thread(_unsubscribe_chat, chat_id, target_topic, now):
+                    await _send_message(chat_id, f"Unsubscribed from: {target_topic}")
                 else:
-                    _send_message(chat_id, f"You are not subscribed to: {target_topic}")
+                    await _send_message(chat_id, f"You are not subscribed to: {target_topic}")
         elif text == "/unsubscribe_all":
             now = int(time.time())
-            subs = _read_json(SUBSCRIPTIONS_FILE, default={"chats": {}, "topics": {}})
-            topics_for_chat = _chat_topics(subs, chat_id)
-            if topics_for_chat:
-                _save_chat_topics(subs, chat_id, set(), now)
-                _write_json_atomic(SUBSCRIPTIONS_FILE, subs)
-                _send_message(chat_id, "Unsubscribed from all topics.")
+            if await asyncio.to_thread(_unsubscribe_chat, chat_id, None, now):
+                await _send_message(chat_id, "Unsubscribed from all topics.")
             else:
-                _send_message(chat_id, "You are not subscribed to any topics.")
+                await _send_message(chat_id, "You are not subscribed to any topics.")
         return {"ok": True}
 
     payload = text.split(" ", 1)[1].strip()
@@ -481,99 +1108,67 @@ async def telegram_webhook(
         return {"ok": True}
 
     now = int(time.time())
-    pending = _read_json(PENDING_FILE, default={})
-    pending = _prune_pending(pending, now)
-    record = pending.pop(token, None)
-    _write_json_atomic(PENDING_FILE, pending)
-
+    record = await asyncio.to_thread(_confirm_subscription, token, chat_id, message.get("from") or {}, now)
     if not record:
-        _send_message(chat_id, "This subscribe link is invalid or expired. Please generate a new one from the website.")
+        await _send_message(chat_id, "This subscribe link is invalid or expired. Please generate a new one from the website.")
         return {"ok": True}
 
     topic = str(record.get("topic", "")).strip().lower()
     if not topic:
-        _send_message(chat_id, "Could not process this subscription token. Please try again.")
+        await _send_message(chat_id, "Could not process this subscription token. Please try again.")
         return {"ok": True}
 
-    subs = _read_json(SUBSCRIPTIONS_FILE, default={"chats": {}, "topics": {}})
-    chats = subs.setdefault("chats", {})
-    current_topics = _chat_topics(subs, chat_id)
-    current_topics.add(topic)
-    chat_key = str(chat_id)
-
-    from_user = message.get("from") or {}
-    chats[chat_key] = {
-        "chat_id": chat_id,
-        "username": from_user.get("username"),
-        "first_name": from_user.get("first_name"),
-        "last_name": from_user.get("last_name"),
-        "topics": sorted(current_topics),
-        "updated_at": now,
-    }
-
-    topic_chat_ids = set(subs.setdefault("topics", {}).get(topic, []))
-    topic_chat_ids.add(str(chat_id))
-    subs["topics"][topic] = sorted(topic_chat_ids)
-
-    _write_json_atomic(SUBSCRIPTIONS_FILE, subs)
-    statuses = _read_json(LINK_STATUS_FILE, default={})
-    statuses = _prune_link_status(statuses, now)
-    statuses[token] = {
-        "topic": topic,
-        "created_at": int(record.get("created_at", now)),
-        "expires_at": int(record.get("expires_at", now)),
-        "status": "confirmed",
-        "confirmed_at": now,
-    }
-    _write_json_atomic(LINK_STATUS_FILE, statuses)
-
-    _send_message(chat_id, f"Subscribed successfully. You will now receive alerts for: {topic}")
+    await _send_message(chat_id, f"Subscribed successfully. You will now receive alerts for: {topic}")
     return {"ok": True}
 
 
 @app.get("/api/telegram/topics/{topic}/chat-ids")
 def get_chat_ids_for_topic(topic: str) -> dict[str, Any]:
     clean_topic = _sanitize_topic(topic)
-    subs = _read_json(SUBSCRIPTIONS_FILE, default={"topics": {}})
-    topic_chat_ids = subs.get("topics", {}).get(clean_topic, [])
-    chat_ids = [int(chat_id) for chat_id in topic_chat_ids]
+    chat_ids = _load_topic_chat_ids(clean_topic)
     return {"topic": clean_topic, "chat_ids": chat_ids}
 
 
 @app.get("/api/telegram/subscriptions")
 def get_subscriptions() -> dict[str, Any]:
-    return _read_json(SUBSCRIPTIONS_FILE, default={"chats": {}, "topics": {}})
+    return _load_subscriptions()
 
 
 @app.post("/api/telegram/topics/{topic}/notify")
-def notify_topic_subscribers(topic: str, body: TopicBroadcastRequest) -> dict[str, Any]:
+async def notify_topic_subscribers(topic: str, body: TopicBroadcastRequest) -> dict[str, Any]:
     clean_topic = _sanitize_topic(topic)
     if not body.text and not body.audio_url:
         raise HTTPException(status_code=400, detail="At least one of text or audio_url is required")
 
-    subs = _read_json(SUBSCRIPTIONS_FILE, default={"topics": {}})
-    topic_chat_ids = subs.get("topics", {}).get(clean_topic, [])
-    chat_ids = [int(chat_id) for chat_id in topic_chat_ids]
+    chat_ids = await asyncio.to_thread(_load_topic_chat_ids, clean_topic)
+
+    semaphore = asyncio.Semaphore(BROADCAST_CONCURRENCY)
+
+    async def deliver(chat_id: int) -> None:
+        head = b'{"chat_id":%d,' % chat_id
+        async with semaphore:
+            for method, tail in body_tails:
+                async with _tg_rate:
+                    await _telegram_post_async(method, head + tail)
+
+    # One client for the whole fan-out, even when there is no shared client for this loop.
+    async with _telegram_session():
+        if STORAGE_CHAT_ID and chat_ids:
+            requests = await _stage_broadcast(body)
+        else:
+            requests = _broadcast_requests(body)
+        # Serialize each payload once; per chat only the leading chat_id field differs.
+        body_tails = [(method, orjson.dumps(payload)[1:]) for method, payload in requests]
+
+        results = await asyncio.gather(*(deliver(chat_id) for chat_id in chat_ids), return_exceptions=True)
 
     delivered = 0
     failed: list[dict[str, Any]] = []
-
-    for chat_id in chat_ids:
-        try:
-            if body.text:
-                _telegram_api(
-                    "sendMessage",
-                    {
-                        "chat_id": chat_id,
-                        "text": body.text,
-                        "disable_web_page_preview": body.disable_web_page_preview,
-                    },
-                )
-            if body.audio_url:
-                _send_audio(chat_id, body.audio_url, body.caption)
+    for chat_id, result in zip(chat_ids, results):
+        if isinstance(result, Exception):  # pragma: no cover - network/API failure path
+            failed.append({"chat_id": chat_id, "error": str(result)})
+        else:
             delivered += 1
-        except Exception as exc:  # pragma: no cover - network/API failure path
-            failed.append({"chat_id": chat_id, "error": str(exc)})
 
     return {
         "topic": clean_topic,
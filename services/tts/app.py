@@ -1,16 +1,19 @@
 """Edge TTS Service - Free text-to-speech API."""
 
 import asyncio
-import io
+import time
 import uuid
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 import edge_tts
 
 app = FastAPI(title="Edge TTS Service", version="1.0.0")
 
+VOICES_CACHE_TTL_SECONDS = 3600
+_voices_cache: tuple[float, list] | None = None
+
 
 class TTSRequest(BaseModel):
     text: str
@@ -27,48 +30,61 @@ async def health():
 @app.get("/voices")
 async def list_voices():
     """List available voices."""
+    global _voices_cache
+    now = time.time()
+    if _voices_cache and now - _voices_cache[0] < VOICES_CACHE_TTL_SECONDS:
+        return {"voices": _voices_cache[1]}
+
     voices = await edge_tts.list_voices()
-    english_voices = [v for v in voices if v["Locale"].startswith("en-")]
-    return {
-        "voices": [
-            {"name": v["ShortName"], "gender": v["Gender"], "locale": v["Locale"]}
-            for v in english_voices
-        ]
-    }
+    english_voices = [
+        {"name": v["ShortName"], "gender": v["Gender"], "locale": v["Locale"]}
+        for v in voices
+        if v["Locale"].startswith("en-")
+    ]
+    _voices_cache = (now, english_voices)
+    return {"voices": english_voices}
 
 
 @app.post("/synthesize")
 async def synthesize(request: TTSRequest):
-    """Convert text to speech and return MP3 audio."""
+    """Convert text to speech and stream MP3 audio as it is synthesized."""
     if not request.text or len(request.text.strip()) == 0:
         raise HTTPException(status_code=400, detail="Text cannot be empty")
 
     if len(request.text) > 10000:
         raise HTTPException(status_code=400, detail="Text too long (max 10000 chars)")
 
-    try:
+    async def audio_chunks():
         communicate = edge_tts.Communicate(
             request.text,
             request.voice,
             rate=request.rate,
             pitch=request.pitch,
         )
-
-        audio_data = io.BytesIO()
         async for chunk in communicate.stream():
             if chunk["type"] == "audio":
-                audio_data.write(chunk["data"])
-
-        audio_data.seek(0)
-        return Response(
-            content=audio_data.read(),
-            media_type="audio/mpeg",
-            headers={"Content-Disposition": f"attachment; filename={uuid.uuid4()}.mp3"},
-        )
+                yield chunk["data"]
 
+    # Wait for the first chunk so synthesis errors still surface as a 500
+    chunks = audio_chunks()
+    try:
+        first_chunk = await anext(chunks)
+    except StopAsyncIteration:
+        raise HTTPException(status_code=500, detail="TTS failed: no audio received")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"TTS failed: {str(e)}")
 
+    async def stream_audio():
+        yield first_chunk
+        async for data in chunks:
+            yield data
+
+    return StreamingResponse(
+        stream_audio(),
+        media_type="audio/mpeg",
+        headers={"Content-Disposition": f"attachment; filename={uuid.uuid4()}.mp3"},
+    )
+
 
 if __name__ == "__main__":
     import uvicorn